@@ -1,2 +1,8 @@
 # Backend for NLP operations.
 nlp_backend = "nltk"
+
+# Whether `Document` word-tokenizes the sentences of long documents in a pool of
+# threads. CPython's `re` module holds the GIL while matching, so this only reduces
+# latency on interpreters where tokenization can actually run concurrently (e.g.
+# free-threaded builds).
+threaded_tokenization = False
@@ -1,22 +1,148 @@
+import functools
+import re
+
 import nltk  # type: ignore
-from typing import List, Tuple
+from typing import Dict, List, Sequence, Tuple
+
+__all__ = [
+    "sent_tokenize",
+    "word_tokenize",
+    "word_span_tokenize",
+    "word_tokenize_batch",
+    "document_tokenize",
+    "pos_tag",
+    "cache_clear",
+]
+
+# The pattern of NLTK's `WordPunctTokenizer`: runs of word characters, and runs of
+# punctuation. It is compiled here and matched directly, without going through the
+# tokenizer object and its generators; it cannot backtrack, since the two runs have
+# disjoint character classes, so it needs no match timeout.
+WORD_PUNCT_PATTERN = re.compile(r"\w+|[^\w\s]+")
+
+# Punkt sentence tokenizers, loaded once per language.
+_SENT_TOKENIZERS: Dict[str, nltk.tokenize.PunktSentenceTokenizer] = {}
+
+# Maximum number of texts whose tokenization is cached by `word_tokenize` and
+# `word_span_tokenize`.
+CACHE_SIZE = 4096
+
+# Maximum length of the texts that are cached. Each entry keeps its text and tokens
+# alive after the sentence is gone, about 20 bytes per character of text, so this
+# bounds each cache to roughly 40 MB; longer texts are rarely repeated anyway.
+CACHE_MAX_LENGTH = 512
+
+# On `importlib.reload`, the functions defined by the previous execution of this
+# module are still in the namespace (and possibly re-exported by `minerva`): empty
+# their caches before replacing them, so they do not keep stale entries alive.
+if "cache_clear" in globals():
+    cache_clear()  # type: ignore  # noqa: F821
+
+
+def _sent_tokenizer(language: str) -> nltk.tokenize.PunktSentenceTokenizer:
 
-TOKENIZER = None
+    tokenizer = _SENT_TOKENIZERS.get(language)
+
+    if not tokenizer:
+        tokenizer = nltk.data.load(f"tokenizers/punkt/{language}.pickle")
+        _SENT_TOKENIZERS[language] = tokenizer
+
+    return tokenizer
 
 
 def sent_tokenize(txt: str, language: str = "english") -> List[str]:
 
-    return nltk.sent_tokenize(txt, language)  # type: ignore
+    return _sent_tokenizer(language).tokenize(txt)  # type: ignore
+
+
+def _word_tokenize(txt: str, language: str) -> Tuple[str, ...]:
+
+    return tuple(WORD_PUNCT_PATTERN.findall(txt))
+
+
+def _word_span_tokenize(txt: str, language: str) -> Tuple[Tuple[int, int], ...]:
+
+    return tuple(match.span() for match in WORD_PUNCT_PATTERN.finditer(txt))
+
+
+_cached_word_tokenize = functools.lru_cache(maxsize=CACHE_SIZE)(_word_tokenize)
+_cached_word_span_tokenize = functools.lru_cache(maxsize=CACHE_SIZE)(
+    _word_span_tokenize
+)
+
+
+def word_tokenize(txt: str, language: str = "english") -> Tuple[str, ...]:
+
+    if len(txt) > CACHE_MAX_LENGTH:
+        return _word_tokenize(txt, language)
+
+    return _cached_word_tokenize(txt, language)
+
+
+def word_span_tokenize(
+    txt: str, language: str = "english"
+) -> Tuple[Tuple[int, int], ...]:
+    """
+    Tokenizes a text, returning the position of each token instead of its text.
+    Texts up to `CACHE_MAX_LENGTH` characters are cached.
+
+    :param txt: the text to tokenize.
+    :param language: the language of the text.
+    :return: a tuple of `(start, end)` character offsets, one for each token.
+    """
+
+    if len(txt) > CACHE_MAX_LENGTH:
+        return _word_span_tokenize(txt, language)
+
+    return _cached_word_span_tokenize(txt, language)
+
+
+def word_tokenize_batch(
+    txts: Sequence[str], language: str = "english"
+) -> List[Tuple[str, ...]]:
+    """
+    Tokenizes a list of texts (e.g. the sentences of a document). Each text goes
+    through `word_tokenize`, so texts that have already been tokenized are served
+    from its cache.
+
+    :param txts: the texts to tokenize.
+    :param language: the language of the texts.
+    :return: a list containing the tokens of each text, in the same order as `txts`.
+    """
+
+    return [word_tokenize(txt, language) for txt in txts]
+
+
+def cache_clear() -> None:
+    """
+    Empties the caches of the tokenizer functions, e.g. after reloading a model.
+    Called automatically when this module is reloaded.
+    """
+
+    _cached_word_tokenize.cache_clear()
+    _cached_word_span_tokenize.cache_clear()
 
 
-def word_tokenize(txt: str, language: str = "english") -> List[str]:
+def document_tokenize(
+    txt: str, language: str = "english"
+) -> List[Tuple[str, Tuple[Tuple[int, int], ...]]]:
+    """
+    Splits a document into sentences and tokens in a single pass: the sentence
+    boundaries found by the sentence tokenizer are used directly to run the word
+    tokenizer on each sentence, without tokenizing the sentence texts again.
 
-    global TOKENIZER
+    :param txt: the text of the document.
+    :param language: the language of the document.
+    :return: for each sentence, its text and the `(start, end)` character offsets of
+    its tokens, relative to the sentence.
+    """
 
-    if not TOKENIZER:
-        TOKENIZER = nltk.tokenize.WordPunctTokenizer()
+    sentences = []
+    for start, end in _sent_tokenizer(language).span_tokenize(txt):
+        sentence = txt[start:end]
+        sentences.append((sentence, word_span_tokenize(sentence, language=language)))
 
-    return TOKENIZER.tokenize(txt)  # type: ignore
+    return sentences
 
 
 def pos_tag(txt: str, language: str = "english") -> List[Tuple[str, str]]:
@@ -0,0 +1,70 @@
+"""
+A pool of reusable `Token` objects.
+
+Short-lived documents (e.g. in streaming pipelines) allocate thousands of tokens that
+become garbage as soon as the document is consumed. Documents can hand their tokens
+back to the pool with `Document.release`, and new sentences reuse them instead of
+allocating new objects.
+"""
+
+import threading
+from collections import deque
+from typing import Any, Deque, Optional, Sequence
+
+
+class TokenPool:
+    """
+    A thread-safe pool of released tokens.
+
+    Released tokens are unlinked from their sentence and labels, so the pool never
+    keeps a released document alive. Tokens that are never released are simply
+    garbage collected, as the pool does not track them.
+    """
+
+    def __init__(self, token_class: type, maxsize: int = 65536):
+        """
+        Creates the pool.
+
+        :param token_class: the class of the pooled tokens, used to create new tokens
+        when the pool is empty. It must provide a `_reset` method.
+        :param maxsize: the maximum number of released tokens to keep.
+        """
+        self._token_class = token_class
+        self._free: Deque[Any] = deque(maxlen=maxsize)
+        self._lock = threading.Lock()
+
+    def acquire(self, text: str, index: int, parent: Any, char_index: int) -> Any:
+        """
+        Returns a token with the given fields, reusing a released token if possible.
+
+        :param text: the text of the token.
+        :param index: the index of the token within its parent.
+        :param parent: the parent of the token.
+        :param char_index: the character index of the token within its parent.
+        :return: the token.
+        """
+        token: Optional[Any] = None
+        with self._lock:
+            if self._free:
+                token = self._free.pop()
+
+        if token is None:
+            return self._token_class(text, index, parent, char_index)
+
+        token._reset(text, index, parent, char_index)
+        return token
+
+    def release(self, tokens: Sequence[Any]) -> None:
+        """
+        Returns tokens to the pool. The tokens must not be used afterwards.
+
+        :param tokens: the tokens to return.
+        """
+        for token in tokens:
+            token._reset("", -1, None, -1)
+
+        with self._lock:
+            self._free.extend(tokens)
+
+    def __len__(self) -> int:
+        return len(self._free)
@@ -1,10 +1,117 @@
+import bisect
+import itertools
+import os
+import sys
+import threading
+import types
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Iterable, Optional, overload, Union
+from array import array
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import (
+    Any,
+    Dict,
+    List,
+    Iterable,
+    Mapping,
+    Optional,
+    overload,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import minerva as mine
+from minerva.text._pool import TokenPool
+
+__all__ = [
+    "Annotation",
+    "TokenSpan",
+    "BaseEntity",
+    "BaseTextualEntity",
+    "Token",
+    "Sentence",
+    "Document",
+    "Corpus",
+    "TOKEN_POOL",
+]
+
+# Minimum number of sentences for which `Document(..., parallel=True)` actually
+# spawns worker processes; below this, the process startup cost dominates.
+PARALLEL_MIN_SENTENCES = 256
+
+# Maximum length of the token texts that are interned; 0 disables interning.
+INTERN_MAX_LENGTH = 16
+
+# Minimum number of sentences for which `Document` uses the thread pool, when
+# `config.threaded_tokenization` is enabled.
+THREAD_MIN_SENTENCES = 64
+
+# Marks the tokens without a value in a label column of a `Sentence`; None cannot be
+# used, since it is a valid label value.
+_NO_LABEL = object()
+
+# The shared thread pool, and the id of the process that created it: a process
+# forked by `Corpus.tokenize_parallel` inherits the executor but not its threads, so
+# it has to create its own.
+_THREAD_POOL: Optional[ThreadPoolExecutor] = None
+_THREAD_POOL_PID: Optional[int] = None
+_THREAD_POOL_LOCK = threading.Lock()
+
+
+def _thread_pool() -> ThreadPoolExecutor:
+
+    global _THREAD_POOL, _THREAD_POOL_PID
+
+    with _THREAD_POOL_LOCK:
+        if not _THREAD_POOL or _THREAD_POOL_PID != os.getpid():
+            _THREAD_POOL = ThreadPoolExecutor(max_workers=os.cpu_count())
+            _THREAD_POOL_PID = os.getpid()
+
+        return _THREAD_POOL
+
+
+def _chunksize(n_items: int, n_jobs: int) -> int:
+    """
+    Computes the number of items each worker receives at once, so that every worker
+    gets about four chunks.
+    """
+    return max(1, n_items // (4 * n_jobs))
+
+
+def _build_tokens(
+    text: str, spans: Iterable[Tuple[int, int]], parent: "Sentence"
+) -> List["Token"]:
+    """
+    Creates the tokens of `parent` from their offsets in `text`. This is the inner
+    loop of sentence construction, so it is kept to a single comprehension with
+    positional arguments. Released tokens are reused when the pool has any.
+    """
+    if TOKEN_POOL:
+        acquire = TOKEN_POOL.acquire
+        return [
+            acquire(text[start:end], i, parent, start)
+            for i, (start, end) in enumerate(spans)
+        ]
+
+    return [
+        Token(text[start:end], i, parent, start) for i, (start, end) in enumerate(spans)
+    ]
+
+
+def _build_sentence(text: str, index: int) -> "Sentence":
+    # Module-level, so that it can be pickled and sent to worker processes.
+    return Sentence(text, index=index)
+
+
+def _build_document(text: str) -> "Document":
+    # Module-level, so that it can be pickled and sent to worker processes.
+    return Document(text)
 
 
 class Annotation(ABC):
+
+    __slots__ = ("value", "score", "__annos")
+
     def __init__(
         self, value: str, score: Optional[float] = None, **kwargs: Dict[str, Any]
     ):
@@ -20,12 +127,12 @@ class Annotation(ABC):
         :param kwargs: additional information to store into the annotation
         """
         self.value: str = value
-        self.__annos: Dict[str, Any] = {}
-        for key, value in kwargs:
-            self[key] = value
-
-        if score:
-            self["score"] = score
+        self.score: Optional[float] = score
+        # allocated on the first write of any other field, since most annotations
+        # only have a value and a score
+        self.__annos: Optional[Dict[str, Any]] = None
+        for key, field_value in kwargs.items():
+            self[key] = field_value
 
     def __setitem__(self, key: str, value: Any) -> None:
         """
@@ -39,7 +146,11 @@ class Annotation(ABC):
             raise ValueError(
                 "'value' is a forbidden annotation. Use the class attribute instead."
             )
+        elif key == "score":
+            self.score = value
         else:
+            if self.__annos is None:
+                self.__annos = {}
             self.__annos[key] = value
 
     def __getitem__(self, item: str) -> Any:
@@ -51,8 +162,10 @@ class Annotation(ABC):
         """
         if item == "value":
             return self.value
+        elif item == "score" and self.score is not None:
+            return self.score
         else:
-            if item in self.__annos:
+            if self.__annos is not None and item in self.__annos:
                 return self.__annos[item]
             else:
                 raise KeyError(f"{item} is not a valid annotation field.")
@@ -63,6 +176,8 @@ class TokenSpan(Annotation):
     An annotation over more than one token.
     """
 
+    __slots__ = ("_start_token", "_end_token", "_text")
+
     def __init__(
         self,
         value: str,
@@ -86,11 +201,29 @@ class TokenSpan(Annotation):
         if not end_token:
             end_token = start_token
 
-        super().__init__(value, score)
-        self["start_token"] = start_token
-        self["end_token"] = end_token
-        for key, value in kwargs:
-            self[key] = value
+        self._start_token: "Token" = start_token
+        self._end_token: "Token" = end_token
+        # the text covered by the span, sliced from the sentence on the first access
+        self._text: Optional[str] = None
+        super().__init__(value, score, **kwargs)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key == "start_token":
+            self._start_token = value
+            self._text = None
+        elif key == "end_token":
+            self._end_token = value
+            self._text = None
+        else:
+            super().__setitem__(key, value)
+
+    def __getitem__(self, item: str) -> Any:
+        if item == "start_token":
+            return self._start_token
+        elif item == "end_token":
+            return self._end_token
+        else:
+            return super().__getitem__(item)
 
     @property
     def start_token(self) -> "Token":
@@ -99,8 +232,7 @@ class TokenSpan(Annotation):
 
         :return: the first token of the annotation
         """
-        t: "Token" = self["start_token"]
-        return t
+        return self._start_token
 
     @property
     def end_token(self) -> "Token":
@@ -109,8 +241,7 @@ class TokenSpan(Annotation):
 
         :return: the last token of the annotation.
         """
-        t: "Token" = self["end_token"]
-        return t
+        return self._end_token
 
     @property
     def start_index(self) -> int:
@@ -137,10 +268,14 @@ class TokenSpan(Annotation):
 
         :return: the text span covered by the annotations.
         """
+        if self._text is not None:
+            return self._text
+
         if self.start_token.parent:
-            return self.start_token.parent.text[
+            self._text = self.start_token.parent.text[
                 self.start_token.char_index : self.end_token.end_char_index
             ]
+            return self._text
 
         raise ValueError(
             "This TokenSpan was probably not created from a sentence. You should always use \
@@ -153,6 +288,8 @@ class BaseEntity(ABC):
     A basic entity.
     """
 
+    __slots__ = ("text", "language")
+
     def __init__(self, text: str, language: str = "en"):
         """
         Initializes the entity.
@@ -181,6 +318,8 @@ class BaseTextualEntity(BaseEntity):
     character index (e.g. it could be the word starting at character 45).
     """
 
+    __slots__ = ("index", "char_index", "parent")
+
     def __init__(
         self,
         text: str,
@@ -201,12 +340,32 @@ class BaseTextualEntity(BaseEntity):
         super().__init__(text, language=language)
         self.index: int = index
         self.char_index: int = char_index
-        self.end_char_index: int = char_index + len(text) if char_index >= 0 else -1
-        self.labels: Dict[str, Annotation] = {}
         self.parent: Optional[BaseEntity] = parent
 
+    @property
+    def end_char_index(self) -> int:
+        """
+        The character index following the end of the entity, or -1 if the entity has
+        no character index. Computed from `char_index` and the text, since storing it
+        would take another slot in every token.
+
+        :return: the character index following the end of the entity.
+        """
+        return self.char_index + len(self.text) if self.char_index >= 0 else -1
+
 
 class Token(BaseTextualEntity):
+    """
+    A token of a sentence. Labels can be read and written with `token[key]`. The
+    labels of the tokens of a `Sentence` are stored by the sentence, in one list per
+    key; tokens without a sentence keep their own dictionary.
+
+    The sentence of a token is its `parent`. Sentences compare by identity, so
+    `token.parent is sentence` is the way to check whether a token belongs to one.
+    """
+
+    __slots__ = ("_labels", "_str_prefix")
+
     def __init__(
         self,
         text: str,
@@ -215,18 +374,99 @@ class Token(BaseTextualEntity):
         char_index: int = -1,
         language: str = "en",
     ):
-        super().__init__(
-            text, index=index, char_index=char_index, language=language, parent=parent
+        # Tokens are created by the thousand, so the fields are set here directly
+        # instead of going through the `BaseTextualEntity`/`BaseEntity` constructors.
+        self.language: str = language
+        self._reset(text, index, parent, char_index)
+
+    def _reset(
+        self, text: str, index: int, parent: Optional[BaseEntity], char_index: int
+    ) -> None:
+        """
+        Reinitializes the token in place, clearing its labels. Used by `TokenPool`.
+        """
+        # short tokens (words, punctuation) repeat a lot across a corpus: interning
+        # them keeps a single copy of each
+        self.text = sys.intern(text) if len(text) <= INTERN_MAX_LENGTH else text
+        self.index = index
+        self.parent = parent
+        self.char_index = char_index
+        # only used when the token is not part of a sentence; allocated on first write
+        self._labels: Optional[Dict[str, Any]] = None
+        # the "Token [i][j]: " part of `str(token)`, computed on the first call
+        self._str_prefix: Optional[str] = None
+
+    def _columns(self) -> Optional[Dict[str, List[Any]]]:
+        """
+        Returns the label columns of the parent sentence, or None if the token is not
+        one of the tokens of a sentence.
+        """
+        parent = self.parent
+        if (
+            isinstance(parent, Sentence)
+            and 0 <= self.index < len(parent.tokens)
+            and parent.tokens[self.index] is self
+        ):
+            return parent._labels
+
+        return None
+
+    @property
+    def labels(self) -> Mapping[str, Any]:
+        """
+        The labels of the token, as a read-only mapping: labels must be set with
+        `token[key] = value`. For tokens of a sentence, this is a snapshot of the
+        labels at the time of the call.
+
+        :return: a mapping from label keys to values.
+        """
+        columns = self._columns()
+        if columns is None:
+            if self._labels is None:
+                self._labels = {}
+            return types.MappingProxyType(self._labels)
+
+        index = self.index
+        return types.MappingProxyType(
+            {
+                key: column[index]
+                for key, column in columns.items()
+                if column[index] is not _NO_LABEL
+            }
         )
 
     def __contains__(self, item):
-        return item in self.labels.keys()
+        columns = self._columns()
+        if columns is None:
+            return self._labels is not None and item in self._labels
+
+        column = columns.get(item)
+        return column is not None and column[self.index] is not _NO_LABEL
 
     def __setitem__(self, key: str, value: Any) -> None:
-        self.labels[key] = value
+        columns = self._columns()
+        if columns is None:
+            if self._labels is None:
+                self._labels = {}
+            self._labels[key] = value
+            return
+
+        column = columns.get(key)
+        if column is None:
+            column = columns[key] = [_NO_LABEL] * len(self.parent)  # type: ignore
+        column[self.index] = value
 
     def __getitem__(self, item: str) -> Any:
-        return self.labels[item]
+        columns = self._columns()
+        if columns is None:
+            if self._labels is None:
+                raise KeyError(item)
+            return self._labels[item]
+
+        column = columns.get(item)
+        if column is None or column[self.index] is _NO_LABEL:
+            raise KeyError(item)
+        return column[self.index]
 
     def __iter__(self) -> Iterable:
         return iter(self.labels)
@@ -235,30 +475,88 @@ class Token(BaseTextualEntity):
         return len(self.text)
 
     def __str__(self) -> str:
-        if self.parent and self.parent.index >= 0:
-            index = (
-                f"[{self.parent.index}][{str(self.index)}]" if self.index >= 0 else ""
-            )
-        else:
-            index = f"[{str(self.index)}]" if self.index >= 0 else ""
-        return f"Token {index}: {self.text}"
+        if self._str_prefix is None:
+            if self.parent and self.parent.index >= 0:
+                index = (
+                    f"[{self.parent.index}][{str(self.index)}]"
+                    if self.index >= 0
+                    else ""
+                )
+            else:
+                index = f"[{str(self.index)}]" if self.index >= 0 else ""
+            self._str_prefix = f"Token {index}: "
+        return self._str_prefix + self.text
+
+
+# Tokens released by `Document.release`, reused when building new sentences.
+TOKEN_POOL = TokenPool(Token)
 
 
 class Sentence(BaseTextualEntity):
-    def __init__(self, text: str, index: int = -1, parent: BaseEntity = None):
+
+    __slots__ = (
+        "tokens",
+        "annotations",
+        "_starts",
+        "_ends",
+        "_last_hit",
+        "_labels",
+        "_str_prefix",
+    )
+
+    def __init__(
+        self,
+        text: str,
+        index: int = -1,
+        parent: BaseEntity = None,
+        tokens: Optional[Sequence[str]] = None,
+        spans: Optional[Sequence[Tuple[int, int]]] = None,
+    ):
+        """
+        Creates the sentence and splits it into tokens. If the text has already been
+        tokenized (e.g. by `Document`, which tokenizes all its sentences at once), the
+        tokens can be passed via `tokens`, or their offsets via `spans`, to skip the
+        tokenizer call.
+
+        :param text: the text of the sentence.
+        :param index: the index of the sentence within its parent.
+        :param parent: the parent entity.
+        :param tokens: the tokens of `text`, as returned by `mine.word_tokenize`.
+        :param spans: the offsets of the tokens of `text`, as returned by
+        `mine.word_span_tokenize`. Ignored if `tokens` is given.
+        """
         super().__init__(text, index=index, parent=parent)
-        self.tokens: List[Token] = []
+        # the "Sentence [i]: " part of `str(sentence)`, computed on the first call
+        self._str_prefix: Optional[str] = None
+        self.tokens: List[Token]
         self.annotations: Dict[str, Annotation] = {}
+        # token labels, stored as one list per key with an entry (or `_NO_LABEL`) per
+        # token
+        self._labels: Dict[str, List[Any]] = {}
 
         # generate tokens
-        processed_text = text
-        for word in mine.word_tokenize(text):
-            tok_pos = 0 if len(self) == 0 else self.tokens[len(self) - 1].end_char_index
-            tok_pos += processed_text.index(word)
-            self.tokens.append(
-                Token(word, index=len(self), parent=self, char_index=tok_pos)
-            )
-            processed_text = text[tok_pos + len(word) :]
+        if tokens is None:
+            if spans is None:
+                spans = mine.word_span_tokenize(text)
+            self.tokens = _build_tokens(text, spans, self)
+        else:
+            self.tokens = []
+            # tokens appear in order, so each one is searched for starting from
+            # the end of the previous one
+            cursor = 0
+            for i, word in enumerate(tokens):
+                tok_pos = text.index(word, cursor)
+                self.tokens.append(
+                    Token(word, index=i, parent=self, char_index=tok_pos)
+                )
+                cursor = tok_pos + len(word)
+
+        # token offsets, stored contiguously for the binary search in `token_at_char`;
+        # built on the first lookup, since most sentences are never searched
+        self._starts: Optional[array] = None
+        self._ends: Optional[array] = None
+        # the position of the token found by the last lookup
+        self._last_hit = -1
 
     def add_annotation(
         self,
@@ -270,40 +568,51 @@ class Sentence(BaseTextualEntity):
         **kwargs,
     ) -> None:
         if begin is not None and end is not None:
+            if not 0 <= begin < end <= len(self):
+                raise IndexError(
+                    f"span [{begin}, {end}) is out of range for the sentence "
+                    f"'{self.text}' ({len(self)} tokens)"
+                )
+
             ann = TokenSpan(value, self[begin], self[end - 1], score, **kwargs)
-            for token in self[begin:end]:
-                token[key] = ann
+            column = self._labels.get(key)
+            if column is None:
+                column = self._labels[key] = [_NO_LABEL] * len(self)
+            column[begin:end] = [ann] * (end - begin)
 
         else:
             self.annotations[key] = Annotation(value, score, **kwargs)
 
     def get_annotation(self, key: str) -> Union[Annotation, List[Annotation]]:
 
-        if key in self.annotations:
-            return self.annotations[key]
+        annotation = self.annotations.get(key)
+        if annotation is not None:
+            return annotation
 
         anns: List[Annotation] = []
 
-        i = 0
-        while i < len(self):
+        column = self._labels.get(key)
+        if column is not None:
+            n_tokens = len(column)
+            i = 0
+            while i < n_tokens:
 
-            token = self[i]
-            if key in token:
-                if isinstance(token[key], TokenSpan):
-                    i = token[key].end_index
-
-                anns.append(token[key])
-            i += 1
+                label = column[i]
+                if label is not _NO_LABEL:
+                    anns.append(label)
+                    if isinstance(label, TokenSpan):
+                        i = label.end_index
+                i += 1
 
         if len(anns) > 0:
             return anns
         else:
-            return None
+            raise KeyError(f"{key} is not a valid annotation key.")
 
     def token_at_char(self, index: int) -> Optional[Token]:
         """
-        Return the token at position `index`. Performed using binary search,
-         hence runtime is $O(log(n))$. If the there is no token at the given
+        Return the token at position `index`. Performed using binary search over the
+         token offsets, hence runtime is $O(log(n))$. If the there is no token at the given
           index (e.g. the index points to a whitespace), returns None.
 
         :param index: a character position within the string
@@ -311,28 +620,61 @@ class Sentence(BaseTextualEntity):
         points to a non-token character.
         """
 
-        if index < 0 or index > len(self.text):
-            raise IndexError(
-                f"index {index} is too small/big for the sentence '{self.text}'"
+        return self.tokens_at_chars((index,))[0]
+
+    def _offsets(self) -> Tuple[array, array]:
+        """
+        Returns the start and end offsets of the tokens, building them on first use.
+        """
+        if self._starts is None or self._ends is None:
+            self._starts = array("i", [token.char_index for token in self.tokens])
+            self._ends = array(
+                "i", [token.char_index + len(token.text) for token in self.tokens]
             )
 
-        token: Optional[Token] = None
+        return self._starts, self._ends
 
-        left = 0
-        right = len(self) - 1
+    def tokens_at_chars(self, indices: Iterable[int]) -> List[Optional[Token]]:
+        """
+        Return the tokens at each of the positions in `indices`, as in `token_at_char`.
+        Looking up many positions at once is faster than calling `token_at_char` in a
+        loop.
 
-        while left <= right:
-            middle = (left + right) // 2
+        :param indices: character positions within the string
+        :return: for each position, the token at that position, or None if it points
+        to a non-token character.
+        """
 
-            if self[middle].char_index <= index <= self[middle].end_char_index - 1:
-                token = self[middle]
-                break
-            elif index < self[middle].char_index:
-                right = middle - 1
+        length = len(self.text)
+        starts, ends = self._offsets()
+        tokens = self.tokens
+        bisect_right = bisect.bisect_right
+
+        # lookups usually come in increasing order (e.g. scanning the text), so the
+        # token found by the previous lookup is checked before searching
+        last = self._last_hit
+
+        found: List[Optional[Token]] = []
+        for index in indices:
+            if index < 0 or index > length:
+                raise IndexError(
+                    f"index {index} is too small/big for the sentence '{self.text}'"
+                )
+
+            if 0 <= last < len(starts) and starts[last] <= index < ends[last]:
+                found.append(tokens[last])
+                continue
+
+            # the last token starting at or before `index`
+            position = bisect_right(starts, index) - 1
+            if position >= 0 and index < ends[position]:
+                found.append(tokens[position])
+                last = position
             else:
-                left = middle + 1
+                found.append(None)
 
-        return token
+        self._last_hit = last
+        return found
 
     @overload
     def __getitem__(self, idx: int) -> Token:
@@ -352,25 +694,158 @@ class Sentence(BaseTextualEntity):
         return len(self.tokens)
 
     def __str__(self) -> str:
-        index = f"[{str(self.index)}]" if self.index >= 0 else ""
-        return f"Sentence {index}: {self.text}"
+        if self._str_prefix is None:
+            index = f"[{str(self.index)}]" if self.index >= 0 else ""
+            self._str_prefix = f"Sentence {index}: "
+        return self._str_prefix + self.text
 
 
 class Document(BaseEntity):
-    def __init__(self, text: str, _id: Optional[str] = None, language: str = "en"):
+
+    __slots__ = ("sentences", "id", "_sentence_starts")
+
+    def __init__(
+        self,
+        text: Union[str, Sequence[str]],
+        _id: Optional[str] = None,
+        language: str = "en",
+        parallel: bool = False,
+    ):
+        """
+        Creates the document, splitting it into sentences and tokens.
+
+        With `parallel=True`, documents longer than `PARALLEL_MIN_SENTENCES` sentences
+        are tokenized by a pool of worker processes, one per CPU. Since the workers
+        import the calling module, scripts that use it must guard their entry point
+        with `if __name__ == "__main__":` on platforms that spawn processes.
+
+        Otherwise, if `config.threaded_tokenization` is enabled, documents longer than
+        `THREAD_MIN_SENTENCES` sentences are word-tokenized by a shared thread pool.
+
+        :param text: the text of the document, or a list of its sentences.
+        :param _id: the identifier of the document.
+        :param language: the language of the document.
+        :param parallel: whether to tokenize the sentences in parallel.
+        """
 
         if isinstance(text, str):
             super().__init__(text=text, language=language)
         else:
             super().__init__(text="\n".join(text), language=language)
 
-        sentences_txt = mine.sent_tokenize(text) if isinstance(text, str) else text
+        self.sentences: List[Sentence]
+        threaded = mine.config.threaded_tokenization
 
-        self.sentences: List[Sentence] = [
-            Sentence(sentences_txt[i], index=i) for i in range(len(sentences_txt))
-        ]
+        if isinstance(text, str) and not parallel and not threaded:
+            # split into sentences and tokens in a single pass
+            self.sentences = [
+                Sentence(sentence_txt, index=i, spans=spans)
+                for i, (sentence_txt, spans) in enumerate(mine.document_tokenize(text))
+            ]
+        else:
+            sentences_txt = mine.sent_tokenize(text) if isinstance(text, str) else text
+
+            if parallel and len(sentences_txt) > PARALLEL_MIN_SENTENCES:
+                n_jobs = os.cpu_count() or 1
+                with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+                    self.sentences = list(
+                        executor.map(
+                            _build_sentence,
+                            sentences_txt,
+                            range(len(sentences_txt)),
+                            chunksize=_chunksize(len(sentences_txt), n_jobs),
+                        )
+                    )
+            elif threaded and len(sentences_txt) > THREAD_MIN_SENTENCES:
+                # only the tokenizer runs in the threads; tokens are built here
+                sentences_spans = list(
+                    _thread_pool().map(mine.word_span_tokenize, sentences_txt)
+                )
+                self.sentences = [
+                    Sentence(sentences_txt[i], index=i, spans=sentences_spans[i])
+                    for i in range(len(sentences_txt))
+                ]
+            else:
+                # the same work as `document_tokenize`, reusing the sentences above
+                self.sentences = [
+                    Sentence(
+                        sentences_txt[i],
+                        index=i,
+                        spans=mine.word_span_tokenize(sentences_txt[i]),
+                    )
+                    for i in range(len(sentences_txt))
+                ]
         self.id: Optional[str] = _id
 
+        # offsets of the sentences within `text`: when the sentences are given, the
+        # text is their concatenation, so they follow from the lengths; otherwise
+        # they are located on first use
+        self._sentence_starts: Optional[array] = None
+        if not isinstance(text, str) and len(text) > 0:
+            self._sentence_starts = array(
+                "i",
+                itertools.accumulate(
+                    itertools.chain([0], (len(t) + 1 for t in text[:-1]))
+                ),
+            )
+
+    def release(self) -> None:
+        """
+        Returns the tokens of the document to the token pool, so that they can be
+        reused by documents created later. The document is left empty, and neither it
+        nor its tokens must be used afterwards.
+        """
+        for sentence in self.sentences:
+            TOKEN_POOL.release(sentence.tokens)
+            sentence.tokens = []
+            sentence._starts = None
+            sentence._ends = None
+            sentence._last_hit = -1
+            sentence._labels = {}
+
+        self.sentences = []
+        self._sentence_starts = None
+
+    def token_texts_in_range(self, start: int, end: int) -> List[str]:
+        """
+        Returns the texts of the tokens lying entirely between the character offsets
+        `start` (inclusive) and `end` (exclusive) of the document text. Sentences and
+        tokens are located by binary search over their offsets, so only the tokens in
+        the range are visited.
+
+        :param start: the first character offset of the range.
+        :param end: the character offset after the end of the range.
+        :return: the texts of the tokens in the range, in document order.
+        """
+
+        if self._sentence_starts is None:
+            # sentences appear in order within the text
+            sentence_starts = array("i")
+            cursor = 0
+            for sentence in self.sentences:
+                cursor = self.text.index(sentence.text, cursor)
+                sentence_starts.append(cursor)
+                cursor += len(sentence.text)
+            self._sentence_starts = sentence_starts
+
+        sentence_starts = self._sentence_starts
+
+        texts: List[str] = []
+        i = max(bisect.bisect_right(sentence_starts, start) - 1, 0)
+        while i < len(self.sentences) and sentence_starts[i] < end:
+            sentence = self.sentences[i]
+            offset = sentence_starts[i]
+            starts, ends = sentence._offsets()
+
+            j = bisect.bisect_left(starts, start - offset)
+            while j < len(starts) and ends[j] <= end - offset:
+                texts.append(sentence.tokens[j].text)
+                j += 1
+
+            i += 1
+
+        return texts
+
     def __getitem__(self, idx: int) -> Sentence:
         return self.sentences[idx]
 
@@ -385,30 +860,181 @@ class Document(BaseEntity):
 
 
 class Corpus:
-    def __init__(self, _id: str = None, items: List[BaseEntity] = None):
+    def __init__(
+        self,
+        _id: str = None,
+        items: Union[List[BaseEntity], List[str]] = None,
+        n_jobs: Optional[int] = None,
+        _sources: List[List[BaseEntity]] = None,
+    ):
+        """
+        Creates the corpus.
+
+        Internally, the corpus is the concatenation of one or more lists of items, so
+        that `+` can share the lists of both operands instead of copying them. Shared
+        lists are never modified: new items are added to a list owned by this corpus
+        only. Lists that the caller holds too (the `items` passed here or returned by
+        the `items` property) can be modified by the caller at any time, so `+`
+        copies them instead, as it copied every list before.
+
+        If `items` is a list of texts, a `Sentence` is created for each of them. With
+        `n_jobs` greater than 1, lists longer than `PARALLEL_MIN_SENTENCES` texts are
+        tokenized by a pool of `n_jobs` worker processes, as in `tokenize_parallel`.
+
+        :param _id: the identifier of the corpus.
+        :param items: the initial items of the corpus, or the texts of its sentences.
+        :param n_jobs: the number of worker processes used to create the sentences.
+        :param _sources: the lists of items to concatenate, used by `+`.
+        """
         self.id: Optional[str] = _id
-        self.items: List[BaseEntity]
 
-        if items:
-            self.items = items
+        entities: Optional[List[BaseEntity]] = items  # type: ignore
+        if items and all(isinstance(item, str) for item in items):
+            entities = self._build_sentences(items, n_jobs)  # type: ignore
+
+        # the lists concatenated by this corpus; only `_tail` may be appended to
+        self._sources: List[List[BaseEntity]]
+        self._tail: Optional[List[BaseEntity]] = None
+        # the list of items that the caller holds too, if any; it is always the only
+        # source of the corpus
+        self._borrowed: Optional[List[BaseEntity]] = None
+        if _sources is not None:
+            self._sources = list(_sources)
+        elif entities:
+            self._sources = [entities]
+            self._tail = entities
+            if entities is items:
+                self._borrowed = entities
         else:
-            self.items = []
+            self._sources = []
+
+        # the index of the first item of each source, rebuilt when sources are added
+        self._source_starts: List[int] = []
+
+    @staticmethod
+    def _build_sentences(texts: List[str], n_jobs: Optional[int]) -> List[BaseEntity]:
+
+        if not n_jobs or n_jobs <= 1 or len(texts) <= PARALLEL_MIN_SENTENCES:
+            return [Sentence(text) for text in texts]
+
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            return list(
+                executor.map(
+                    _build_sentence,
+                    texts,
+                    itertools.repeat(-1, len(texts)),
+                    chunksize=_chunksize(len(texts), n_jobs),
+                )
+            )
+
+    def _own_tail(self) -> List[BaseEntity]:
+
+        if self._tail is None:
+            self._tail = []
+            self._sources.append(self._tail)
+
+        return self._tail
+
+    @property
+    def items(self) -> List[BaseEntity]:
+        """
+        The items of the corpus, as a single list. Concatenated sources are merged
+        into a new list owned by this corpus on first access.
+
+        :return: the list of items.
+        """
+        if len(self._sources) != 1 or self._tail is not self._sources[0]:
+            self._tail = list(itertools.chain.from_iterable(self._sources))
+            self._sources = [self._tail]
+            self._source_starts = []
+
+        # the caller may now modify the list
+        self._borrowed = self._tail
+        return self._tail
+
+    @items.setter
+    def items(self, items: List[BaseEntity]) -> None:
+        self._sources = [items]
+        self._tail = items
+        self._borrowed = items
+        self._source_starts = []
+
+    def _shared_sources(self) -> List[List[BaseEntity]]:
+        """
+        Returns the sources of the corpus, to be shared with the result of `+`: the
+        list that the caller holds too is copied, the others are frozen.
+        """
+        if self._borrowed is not None:
+            # the corpus keeps adding to the caller's list, the result gets a copy
+            return [list(self._borrowed)]
+
+        self._tail = None
+        return self._sources
 
     def add(self, item: BaseEntity) -> None:
-        self.items.append(item)
+        self._own_tail().append(item)
+
+    def tokenize_parallel(self, texts: List[str], n_jobs: Optional[int] = None) -> None:
+        """
+        Creates a `Document` for each text and adds it to the corpus. Documents are
+        built by a pool of `n_jobs` worker processes, and added in the same order as
+        `texts`. Since the workers import the calling module, scripts that use this
+        method must guard their entry point with `if __name__ == "__main__":` on
+        platforms that spawn processes.
+
+        :param texts: the texts of the documents.
+        :param n_jobs: the number of worker processes; defaults to the number of CPUs.
+        """
+        if not n_jobs:
+            n_jobs = os.cpu_count() or 1
+
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            self._own_tail().extend(
+                executor.map(
+                    _build_document, texts, chunksize=_chunksize(len(texts), n_jobs)
+                )
+            )
 
     def __add__(self, other) -> "Corpus":
         new_id = self.id + " + " + other.id if self.id and other.id else ""
-        return Corpus(new_id, self.items + other.items)
+        # later additions to either operand go to new lists, or to the caller's list
+        return Corpus(new_id, _sources=self._shared_sources() + other._shared_sources())
 
+    @overload
     def __getitem__(self, idx: int) -> BaseEntity:
-        return self.items[idx]
+        pass
+
+    @overload
+    def __getitem__(self, idx: slice) -> List[BaseEntity]:
+        pass
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return list(self)[idx]
+
+        if len(self._sources) == 1:
+            return self._sources[0][idx]
+
+        if idx < 0:
+            idx += len(self)
+        if idx < 0:
+            raise IndexError("corpus index out of range")
+
+        # shared lists never change and the caller's list is always the only source,
+        # so only the last source can grow: the starts of the others never change
+        if len(self._source_starts) != len(self._sources):
+            self._source_starts = [0]
+            for source in self._sources[:-1]:
+                self._source_starts.append(self._source_starts[-1] + len(source))
+
+        source = bisect.bisect_right(self._source_starts, idx) - 1
+        return self._sources[source][idx - self._source_starts[source]]
 
     def __iter__(self) -> Iterable:
-        return iter(self.items)
+        return itertools.chain.from_iterable(self._sources)
 
     def __len__(self) -> int:
-        return len(self.items)
+        return sum(len(source) for source in self._sources)
 
     def __str__(self) -> str:
         return f"Corpus: {self.id} ({len(self)} items)"
@@ -8,7 +8,7 @@ import os
 import sys
 from shutil import rmtree
 
-from setuptools import find_packages, setup, Command
+from setuptools import find_packages, setup, Command, Extension
 
 # Package meta-data.
 NAME = "minerva"
@@ -27,6 +27,36 @@ EXTRAS = {
     # 'fancy feature': ['django'],
 }
 
+# Modules compiled with Cython, when it is installed. The compiled modules replace
+# the pure-Python ones, which are still installed and used if compilation fails.
+# Set MINERVA_NO_CYTHON=1 to install the pure-Python modules only.
+CYTHON_MODULES = ["minerva.text.base"]
+
+
+def cython_extensions():
+    if os.environ.get("MINERVA_NO_CYTHON") == "1":
+        return []
+
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        return []
+
+    extensions = [
+        Extension(module, [module.replace(".", os.sep) + ".py"], optional=True)
+        for module in CYTHON_MODULES
+    ]
+    return cythonize(
+        extensions,
+        compiler_directives={
+            "language_level": 3,
+            # the modules are plain Python: type annotations are hints for mypy,
+            # not C types to check the arguments against
+            "annotation_typing": False,
+        },
+    )
+
+
 # The rest you shouldn't have to touch too much :)
 # ------------------------------------------------
 # Except, perhaps the License and Trove Classifiers!
@@ -106,6 +136,7 @@ setup(
     # entry_points={
     #     'console_scripts': ['mycli=mymodule:cli'],
     # },
+    ext_modules=cython_extensions(),
     install_requires=REQUIRED,
     extras_require=EXTRAS,
     include_package_data=True,
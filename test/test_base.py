@@ -1,4 +1,5 @@
 import minerva as mine
+import nltk
 import pytest
 
 
@@ -84,7 +85,7 @@ def test_tokenization(sentence, sample_text, sample_tokens):
     assert sentence[0].text == "The"
 
     for i, token in enumerate(sentence):
-        assert token.parent == sentence
+        assert token.parent is sentence
         assert token.text == sample_tokens[i]
         assert token.char_index == sample_text.index(sample_tokens[i])
 
@@ -106,6 +107,13 @@ def test_tokenization(sentence, sample_text, sample_tokens):
     assert not (sentence.token_at_char(sample_text.index("the") + len("the")))
     assert not (sentence.token_at_char(sample_text.index("lazy") + len("lazy")))
 
+    indices = list(range(len(sample_text)))
+    assert sentence.tokens_at_chars(indices) == [
+        sentence.token_at_char(i) for i in indices
+    ]
+    with pytest.raises(IndexError):
+        sentence.tokens_at_chars([0, len(sample_text) + 1])
+
 
 def test_document(lipsum_array, lipsum_txt):
     d1 = mine.Document(lipsum_txt)
@@ -122,6 +130,161 @@ def test_document(lipsum_array, lipsum_txt):
     assert d1.text == d2.text
     assert d1.text == lipsum_txt
 
+    # all the tokenization paths share the same cache entries
+    cache = mine.nlp.wrappers.nltk._cached_word_span_tokenize
+    mine.nlp.wrappers.nltk.cache_clear()
+    mine.Document(lipsum_txt)
+    for lipsum in lipsum_array:
+        mine.Sentence(lipsum)
+    assert cache.cache_info().hits == cache.cache_info().currsize == len(lipsum_array)
+
+
+def test_pretokenized_sentence(lipsum_array):
+
+    tokens = mine.word_tokenize_batch(lipsum_array)
+    assert tokens == [mine.word_tokenize(lipsum) for lipsum in lipsum_array]
+
+    for lipsum, lipsum_tokens in zip(lipsum_array, tokens):
+        s1 = mine.Sentence(lipsum)
+        s2 = mine.Sentence(lipsum, tokens=lipsum_tokens)
+
+        assert len(s1) == len(s2)
+        for t1, t2 in zip(s1, s2):
+            assert t1.text == t2.text
+            assert t1.char_index == t2.char_index
+
+
+def test_long_sentence():
+    # repeated words make any per-token search from the start of the text quadratic
+    word = "lorem "
+    text = word * (2**20 // len(word))
+    n_words = len(text) // len(word)
+
+    for sentence in (
+        mine.Sentence(text),
+        mine.Sentence(text, tokens=["lorem"] * n_words),
+    ):
+        assert len(sentence) == n_words
+        assert sentence[-1].char_index == len(text) - len(word)
+        assert all(t.char_index == t.index * len(word) for t in sentence)
+
+    # long texts are not cached, so they are not kept alive by the tokenizer
+    mine.nlp.wrappers.nltk.cache_clear()
+    mine.Sentence(text)
+    assert mine.nlp.wrappers.nltk._cached_word_span_tokenize.cache_info().currsize == 0
+
+
+def test_interned_tokens(lipsum_array):
+    s1 = mine.Sentence(lipsum_array[0])
+    s2 = mine.Sentence(lipsum_array[1])
+
+    # "ut" appears in both sentences
+    assert s1[15].text == s2[12].text == "ut"
+    assert s1[15].text is s2[12].text
+
+
+def test_word_punct_tokenizer(lipsum_txt, quotes_template, contractions_template_en):
+    tokenizer = nltk.tokenize.WordPunctTokenizer()
+
+    texts = [lipsum_txt] + [
+        text for text, _ in quotes_template + contractions_template_en
+    ]
+    for text in texts:
+        assert list(mine.word_tokenize(text)) == tokenizer.tokenize(text)
+        assert list(mine.word_span_tokenize(text)) == list(
+            tokenizer.span_tokenize(text)
+        )
+
+
+def test_pretokenized_sentence_mismatch():
+    with pytest.raises(ValueError):
+        mine.Sentence("abc", tokens=["zzz"])
+
+
+def test_parallel(lipsum_array, lipsum_txt, monkeypatch):
+    monkeypatch.setattr(mine.text.base, "PARALLEL_MIN_SENTENCES", 0)
+
+    d1 = mine.Document(lipsum_txt)
+    d2 = mine.Document(lipsum_txt, parallel=True)
+
+    assert len(d1) == len(d2)
+    for i in range(len(d1)):
+        assert d2[i].index == i
+        assert [t.text for t in d1[i]] == [t.text for t in d2[i]]
+        assert [t.char_index for t in d1[i]] == [t.char_index for t in d2[i]]
+
+    c = mine.Corpus("parallel")
+    c.tokenize_parallel(lipsum_array + [lipsum_txt], n_jobs=2)
+
+    assert len(c) == len(lipsum_array) + 1
+    assert c[0].text == lipsum_array[0]
+    assert c[-1].text == lipsum_txt
+    assert len(c[-1]) == len(d1)
+
+
+def test_release(lipsum_txt):
+    d1 = mine.Document(lipsum_txt)
+    n_tokens = sum(len(s) for s in d1)
+    d1[0][0]["pos"] = mine.Annotation("NN")
+
+    d1.release()
+    assert len(d1) == 0
+    assert len(mine.TOKEN_POOL) == n_tokens
+
+    d2 = mine.Document(lipsum_txt)
+    assert len(mine.TOKEN_POOL) == 0
+    for sentence in d2:
+        for i, token in enumerate(sentence):
+            assert token.parent is sentence
+            assert token.index == i
+            assert token.text == sentence.text[token.char_index : token.end_char_index]
+            assert "pos" not in token
+
+
+def test_threaded(lipsum_array, lipsum_txt, monkeypatch):
+    d1 = mine.Document(lipsum_txt)
+
+    monkeypatch.setattr(mine.config, "threaded_tokenization", True)
+    for min_sentences in (0, len(d1)):
+        monkeypatch.setattr(mine.text.base, "THREAD_MIN_SENTENCES", min_sentences)
+        d2 = mine.Document(lipsum_txt)
+
+        assert len(d1) == len(d2)
+        for i in range(len(d1)):
+            assert [t.text for t in d1[i]] == [t.text for t in d2[i]]
+            assert [t.char_index for t in d1[i]] == [t.char_index for t in d2[i]]
+
+    # workers forked after the thread pool exists must not reuse it
+    monkeypatch.setattr(mine.text.base, "THREAD_MIN_SENTENCES", 0)
+    c = mine.Corpus("threaded")
+    c.tokenize_parallel(lipsum_array + [lipsum_txt], n_jobs=2)
+    assert len(c) == len(lipsum_array) + 1
+    assert len(c[-1]) == len(d1)
+
+
+def test_str(lipsum_txt):
+    d = mine.Document(lipsum_txt)
+
+    assert str(d[1]) == f"Sentence [1]: {d[1].text}"
+    assert str(d[1][2]) == f"Token [1][2]: {d[1][2].text}"
+    assert str(d[1][2]) == f"Token [1][2]: {d[1][2].text}"
+    assert str(mine.Sentence("a b")[1]) == "Token [1]: b"
+    assert str(mine.Token("a")) == "Token : a"
+
+
+def test_token_texts_in_range(lipsum_array, lipsum_txt):
+    for d in (mine.Document(lipsum_txt), mine.Document(lipsum_array)):
+        assert d.token_texts_in_range(0, len(d.text)) == [t.text for s in d for t in s]
+        assert d.token_texts_in_range(0, len("Lorem ipsum")) == ["Lorem", "ipsum"]
+        assert d.token_texts_in_range(1, len("Lorem ipsum") - 1) == []
+
+        second = d.text.index("Ut enim")
+        assert d.token_texts_in_range(second - 2, second + len("Ut enim")) == [
+            ".",
+            "Ut",
+            "enim",
+        ]
+
 
 def test_corpus(lipsum_array):
 
@@ -141,6 +304,71 @@ def test_corpus(lipsum_array):
     assert c3[-1] == c2[-1]
 
 
+def test_corpus_concatenation(lipsum_array):
+    sentences = [mine.Sentence(lipsum) for lipsum in lipsum_array]
+
+    c1 = mine.Corpus("1", items=sentences[:1])
+    c2 = mine.Corpus("2", items=sentences[1:])
+    c3 = c1 + c2 + c1
+
+    # adding to an operand after concatenating does not change the result
+    c1.add(sentences[1])
+    c2.add(sentences[0])
+    c3.add(sentences[1])
+
+    assert len(c1) == len(c2) == 2
+    assert list(c3) == [sentences[0], sentences[1], sentences[0], sentences[1]]
+    assert [c3[i] for i in range(len(c3))] == list(c3)
+    assert c3[-1] is c3[3]
+    assert c3[1:3] == [sentences[1], sentences[0]]
+    assert c3.items == list(c3)
+    assert c3.id == "1 + 2 + 1"
+
+    with pytest.raises(IndexError):
+        assert c3[len(c3)]
+
+    # lists held by the caller can change after the concatenation
+    l1, l2 = sentences[:1], sentences[1:]
+    c1 = mine.Corpus("1", items=l1)
+    c3 = c1 + mine.Corpus("2", items=l2)
+    assert c3[1] is sentences[1]
+    l1.append(sentences[1])
+    c1.items.append(sentences[0])
+    assert len(c1) == 3
+    assert list(c3) == [c3[0], c3[1]] == sentences
+
+    c4 = c1 + c3
+    c1.items.append(sentences[1])
+    assert (
+        list(c4)
+        == [c4[i] for i in range(len(c4))]
+        == [
+            sentences[0],
+            sentences[1],
+            sentences[0],
+            sentences[0],
+            sentences[1],
+        ]
+    )
+
+    c4.items = sentences[1:]
+    assert list(c4) == sentences[1:]
+
+
+def test_corpus_from_texts(lipsum_array, monkeypatch):
+    c1 = mine.Corpus("1", items=lipsum_array)
+
+    monkeypatch.setattr(mine.text.base, "PARALLEL_MIN_SENTENCES", 0)
+    c2 = mine.Corpus("2", items=lipsum_array, n_jobs=2)
+
+    assert len(c1) == len(c2) == len(lipsum_array)
+    for s1, s2, lipsum in zip(c1, c2, lipsum_array):
+        assert isinstance(s2, mine.Sentence)
+        assert s1.text == s2.text == lipsum
+        assert [t.text for t in s1] == [t.text for t in s2]
+        assert all(t.parent is s2 for t in s2)
+
+
 def test_tags(sentence, sample_pos_tags):
 
     for i, token in enumerate(sentence):
@@ -158,6 +386,9 @@ def test_tags(sentence, sample_pos_tags):
             "test-key", "test-value-2", begin=8, end=11, score=1
         )
 
+    with pytest.raises(IndexError):
+        assert sentence.add_annotation("test-key", "test-value-2", begin=3, end=3)
+
     sentence.add_annotation("test-key", "test-value-2", begin=7, end=9, score=1)
     for t in sentence[7:9]:
         assert t["test-key"].value == "test-value-2"
@@ -165,11 +396,66 @@ def test_tags(sentence, sample_pos_tags):
     spans = sentence.get_annotation("test-key")
     assert spans[0].text == "quick brown fox"
     assert spans[1].text == "lazy dog"
+    assert spans[1].text is spans[1].text
+    spans[1]["end_token"] = sentence[9]
+    assert spans[1].text == sentence.text[sentence[7].char_index :]
 
     with pytest.raises(KeyError):
         assert sentence.get_annotation("test-key-unknown")
 
 
+def test_token_labels(sample_pos_tags):
+    sentence = mine.Sentence("The quick brown fox jumps over the lazy dog.")
+    sentence[1]["pos"] = mine.Annotation(sample_pos_tags[1])
+
+    assert "pos" in sentence[1]
+    assert "pos" not in sentence[0]
+    assert sentence[1].labels == {"pos": sentence[1]["pos"]}
+    assert list(sentence[1]) == ["pos"]
+    assert sentence[0].labels == {}
+    with pytest.raises(KeyError):
+        assert sentence[0]["pos"]
+
+    token = mine.Token("fox")
+    token["pos"] = mine.Annotation("NN")
+    assert token["pos"].value == "NN"
+    assert token.labels == {"pos": token["pos"]}
+
+    # labels are written through the token, not through the mapping
+    for t in (sentence[2], token):
+        with pytest.raises(TypeError):
+            t.labels["pos"] = mine.Annotation("NN")
+
+    # None is a label value like any other
+    sentence[2]["pos"] = None
+    assert "pos" in sentence[2]
+    assert sentence[2]["pos"] is None
+    assert sentence[2].labels == {"pos": None}
+
+    # a token that is not one of the tokens of the sentence has its own labels
+    stray = mine.Token("quick", index=1, parent=sentence)
+    assert "pos" not in stray
+    stray["pos"] = mine.Annotation("RB")
+    assert sentence[1]["pos"].value == sample_pos_tags[1]
+
+
+def test_slots():
+    sentence = mine.Sentence("The quick brown fox jumps over the lazy dog.")
+    sentence.add_annotation("chunk", "NP", 0, 4)
+    entities = [
+        sentence,
+        sentence[0],
+        sentence[0]["chunk"],
+        mine.Annotation("NN", url="http://ontology.org/object"),
+        mine.Document("The quick brown fox jumps over the lazy dog."),
+    ]
+
+    for entity in entities:
+        assert not hasattr(entity, "__dict__")
+    with pytest.raises(AttributeError):
+        sentence[0].misspelled_attribute = True
+
+
 def test_quotes_and_contraptions_en(quotes_template, contractions_template_en):
 
     for sentence, tokens in quotes_template + contractions_template_en: